@@ -9,6 +9,7 @@ from typing import TypeVar
 
 from anyio import create_task_group
 
+from pybooster._private._provider import TupleItemInfo
 from pybooster._private._solution import FULL_SOLUTION
 from pybooster._private._solution import SYNC_SOLUTION
 from pybooster._private._solution import Solution
@@ -38,12 +39,12 @@ def sync_inject_into_params(
     keep_current_values: bool = False,
 ) -> None:
     solution = SYNC_SOLUTION.get()
-    current_values = dict(_CURRENT_VALUES.get())
-
-    _inject_params_into_current_values(param_vals, param_deps, current_values, solution)
-    missing_params = {k: param_deps[k] for k in param_deps.keys() - param_vals}
-    _inject_current_values_into_params(param_vals, missing_params, current_values)
+    current_values, missing_params = _get_current_values_and_missing_params(
+        param_vals, param_deps, solution
+    )
 
+    if current_values is None:
+        return
     if not missing_params:
         if keep_current_values:
             stack.push_callback(_CURRENT_VALUES.reset, _CURRENT_VALUES.set(current_values))
@@ -69,12 +70,12 @@ async def async_inject_into_params(
     keep_current_values: bool = False,
 ) -> None:
     solution = FULL_SOLUTION.get()
-    current_values = dict(_CURRENT_VALUES.get())
-
-    _inject_params_into_current_values(params, required_params, current_values, solution)
-    missing_params = {k: required_params[k] for k in required_params.keys() - params}
-    _inject_current_values_into_params(params, missing_params, current_values)
+    current_values, missing_params = _get_current_values_and_missing_params(
+        params, required_params, solution
+    )
 
+    if current_values is None:
+        return
     if not missing_params:
         if keep_current_values:
             stack.push_callback(_CURRENT_VALUES.reset, _CURRENT_VALUES.set(current_values))
@@ -92,6 +93,26 @@ async def async_inject_into_params(
             _CURRENT_VALUES.reset(current_values_token)
 
 
+def _get_current_values_and_missing_params(
+    param_vals: dict[str, Any],
+    param_deps: HintMap,
+    solution: Solution,
+) -> tuple[dict[Hint, Any] | None, HintDict]:
+    """Get a copy of the current values (or None if they won't change) and the missing params."""
+    current_values = _CURRENT_VALUES.get()
+    if param_vals:
+        new_values = dict(current_values)
+        _inject_params_into_current_values(param_vals, param_deps, new_values, solution)
+        missing_params = {k: param_deps[k] for k in param_deps.keys() - param_vals}
+        _inject_current_values_into_params(param_vals, missing_params, new_values)
+        return new_values, missing_params
+    # fast path - nothing was passed explicitly so every dependency is missing
+    missing_params = dict(param_deps)
+    _inject_current_values_into_params(param_vals, missing_params, current_values)
+    # only copy the current values if providers will need to add to them
+    return (dict(current_values) if missing_params else None), missing_params
+
+
 def _inject_params_into_current_values(
     param_vals: dict[str, Any],
     param_deps: HintMap,
@@ -129,11 +150,11 @@ def _sync_inject_from_provider_values(
     param_vals: dict[str, Any],
     missing_params: HintDict,
     current_values: dict[Hint, Any],
-    solution: Solution[SyncProviderInfo],
+    solution: Solution[SyncProviderInfo | TupleItemInfo],
 ) -> None:
     for exe_group in solution.execution_order_for(missing_params.values(), current_values):
         for prov in exe_group:
-            current_values[prov["provides"]] = _sync_enter_provider(stack, prov, current_values)
+            current_values[prov.provides] = _sync_enter_provider(stack, prov, current_values)
     _inject_current_values_into_params(param_vals, missing_params, current_values)
 
 
@@ -147,19 +168,19 @@ async def _async_inject_from_provider_values(
     for exe_group in solution.execution_order_for(missing_params.values(), current_values):
         match exe_group:
             case [prov]:
-                if prov["is_sync"] is True:
-                    current_values[prov["provides"]] = _sync_enter_provider(
+                if prov.is_sync is True:
+                    current_values[prov.provides] = _sync_enter_provider(
                         stack, prov, current_values
                     )
                 else:
-                    current_values[prov["provides"]] = await _async_enter_provider(
+                    current_values[prov.provides] = await _async_enter_provider(
                         stack, prov, current_values
                     )
             case _:
                 async_provs: list[AsyncProviderInfo] = []
                 for prov in exe_group:
-                    if prov["is_sync"] is True:
-                        current_values[prov["provides"]] = _sync_enter_provider(
+                    if prov.is_sync is True:
+                        current_values[prov.provides] = _sync_enter_provider(
                             stack, prov, current_values
                         )
                     else:
@@ -168,7 +189,7 @@ async def _async_inject_from_provider_values(
                     case []:
                         pass
                     case [prov]:
-                        current_values[prov["provides"]] = await _async_enter_provider(
+                        current_values[prov.provides] = await _async_enter_provider(
                             stack, prov, current_values
                         )
                     case _:
@@ -183,17 +204,23 @@ async def _async_inject_from_provider_values(
                                 for p in async_provs
                             ]
                         for prov, result in provider_futures:
-                            current_values[prov["provides"]] = result()
+                            current_values[prov.provides] = result()
     _inject_current_values_into_params(param_vals, missing_params, current_values)
 
 
 def _sync_enter_provider(
     stack: FastStack | AsyncFastStack,
-    info: SyncProviderInfo,
+    info: SyncProviderInfo | TupleItemInfo,
     current_values: Mapping[Hint, Any],
 ) -> Any:
-    kwargs = {n: current_values[c] for n, c in info["required_parameters"].items()}
-    return info["getter"](stack.enter_context(info["producer"](**kwargs)))
+    if isinstance(info, TupleItemInfo):
+        return info.getter(current_values[info.item_of])
+    if required_parameters := info.required_parameters:
+        kwargs = {n: current_values[c] for n, c in required_parameters.items()}
+        context = info.producer(**kwargs)
+    else:
+        context = info.producer()
+    return info.getter(stack.enter_context(context))
 
 
 async def _async_enter_provider(
@@ -201,8 +228,12 @@ async def _async_enter_provider(
     info: AsyncProviderInfo,
     current_values: Mapping[Hint, Any],
 ) -> Any:
-    kwargs = {n: current_values[c] for n, c in info["required_parameters"].items()}
-    return info["getter"](await stack.enter_async_context(info["producer"](**kwargs)))
+    if required_parameters := info.required_parameters:
+        kwargs = {n: current_values[c] for n, c in required_parameters.items()}
+        context = info.producer(**kwargs)
+    else:
+        context = info.producer()
+    return info.getter(await stack.enter_async_context(context))
 
 
 _CURRENT_VALUES = ContextVar[Mapping[Hint, Any]]("CURRENT_VALUES", default={})
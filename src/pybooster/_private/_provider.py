@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Literal
 from typing import ParamSpec
-from typing import TypedDict
+from typing import TypeAlias
 from typing import TypeVar
 from typing import Union
 from typing import cast
@@ -14,27 +15,31 @@ from typing import overload
 
 from pybooster._private._utils import check_is_concrete_type
 from pybooster._private._utils import check_is_not_builtin_type
+from pybooster._private._utils import frozenclass
 from pybooster._private._utils import get_raw_annotation
 from pybooster._private._utils import is_type
-from pybooster.types import AsyncContextManagerCallable
-from pybooster.types import ContextManagerCallable
-from pybooster.types import Hint
-from pybooster.types import HintMap
-from pybooster.types import InferHint
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from collections.abc import Mapping
 
+    from pybooster.types import AsyncContextManagerCallable
+    from pybooster.types import ContextManagerCallable
+    from pybooster.types import Hint
+    from pybooster.types import HintMap
+    from pybooster.types import InferHint
+
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
-
-AnyContextManagerCallable = ContextManagerCallable[[], R] | AsyncContextManagerCallable[[], R]
+AnyContextManagerCallable: TypeAlias = (
+    "ContextManagerCallable[[], R] | AsyncContextManagerCallable[[], R]"
+)
 
 
-class SyncProviderInfo(TypedDict):
+@frozenclass
+class SyncProviderInfo:
     is_sync: Literal[True]
     producer: ContextManagerCallable[[], Any]
     provides: Hint
@@ -42,7 +47,8 @@ class SyncProviderInfo(TypedDict):
     getter: Callable[[Any], Any]
 
 
-class AsyncProviderInfo(TypedDict):
+@frozenclass
+class AsyncProviderInfo:
     is_sync: Literal[False]
     producer: AsyncContextManagerCallable[[], Any]
     provides: Hint
@@ -50,7 +56,17 @@ class AsyncProviderInfo(TypedDict):
     getter: Callable[[Any], Any]
 
 
-ProviderInfo = SyncProviderInfo | AsyncProviderInfo
+@frozenclass
+class TupleItemInfo:
+    """An item read directly from the value of a tuple without entering any context."""
+
+    is_sync: Literal[True]
+    item_of: Hint
+    provides: Hint
+    getter: Callable[[Any], Any]
+
+
+ProviderInfo = SyncProviderInfo | AsyncProviderInfo | TupleItemInfo
 
 
 def get_provides_type(provides: Hint | Callable[..., Hint], *args: Any, **kwargs: Any) -> Hint:
@@ -71,7 +87,7 @@ def get_provider_info(
     required_params: HintMap,
     *,
     is_sync: Literal[True],
-) -> Mapping[Hint, SyncProviderInfo]: ...
+) -> Mapping[Hint, SyncProviderInfo | TupleItemInfo]: ...
 
 
 @overload
@@ -81,7 +97,7 @@ def get_provider_info(
     required_params: HintMap,
     *,
     is_sync: Literal[False],
-) -> Mapping[Hint, AsyncProviderInfo]: ...
+) -> Mapping[Hint, ProviderInfo]: ...
 
 
 def get_provider_info(
@@ -105,20 +121,19 @@ def _get_tuple_provider_infos(
     *,
     is_sync: bool,
 ) -> dict[Hint, ProviderInfo]:
-    infos_list = (
-        _get_scalar_provider_infos(producer, provides, required_parameters, is_sync=is_sync),
-        *(
-            _get_scalar_provider_infos(
-                producer,
-                item_type,
-                required_parameters,
-                is_sync=is_sync,
-                getter=lambda x, i=index: x[i],  # type: ignore[reportIndexIssue]
-            )
-            for index, item_type in enumerate(get_args(provides))
-        ),
+    infos: dict[Hint, ProviderInfo] = _get_scalar_provider_infos(
+        producer, provides, required_parameters, is_sync=is_sync
     )
-    return {c: i for infos in infos_list for c, i in infos.items()}
+    for index, item_type in enumerate(get_args(provides)):
+        _check_provided_type(item_type)
+        # items are read from the tuple so its producer is only entered once
+        infos[item_type] = TupleItemInfo(
+            is_sync=True,
+            item_of=provides,
+            provides=item_type,
+            getter=itemgetter(index),
+        )
+    return infos
 
 
 def _get_scalar_provider_infos(
@@ -129,13 +144,7 @@ def _get_scalar_provider_infos(
     is_sync: bool,
     getter: Callable[[R], Any] = lambda x: x,
 ) -> dict[Hint, ProviderInfo]:
-    if get_origin(provides) is Union:
-        msg = f"Cannot provide a union type {provides}."
-        raise TypeError(msg)
-
-    raw_anno = get_raw_annotation(provides)
-    check_is_not_builtin_type(raw_anno)
-    check_is_concrete_type(raw_anno)
+    _check_provided_type(provides)
 
     info: ProviderInfo
     if is_sync:
@@ -156,3 +165,13 @@ def _get_scalar_provider_infos(
         )
 
     return {provides: info}
+
+
+def _check_provided_type(provides: Hint) -> None:
+    if get_origin(provides) is Union:
+        msg = f"Cannot provide a union type {provides}."
+        raise TypeError(msg)
+
+    raw_anno = get_raw_annotation(provides)
+    check_is_not_builtin_type(raw_anno)
+    check_is_concrete_type(raw_anno)
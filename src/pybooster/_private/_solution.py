@@ -7,7 +7,7 @@ from collections.abc import Sequence
 from collections.abc import Set
 from contextvars import ContextVar
 from contextvars import Token
-from typing import TYPE_CHECKING
+from dataclasses import field
 from typing import Generic
 from typing import Self
 from typing import TypeVar
@@ -19,14 +19,12 @@ from rustworkx import topological_generations
 
 from pybooster._private._provider import ProviderInfo
 from pybooster._private._provider import SyncProviderInfo
+from pybooster._private._provider import TupleItemInfo
 from pybooster._private._utils import frozenclass
 from pybooster.types import Hint
 from pybooster.types import InjectionError
 from pybooster.types import SolutionError
 
-if TYPE_CHECKING:
-    from pybooster._private._provider import AsyncProviderInfo
-
 P = TypeVar("P", bound=ProviderInfo)
 
 DependencySet = Set[Hint]
@@ -34,8 +32,8 @@ DependencyMap = Mapping[Hint, DependencySet]
 
 
 def set_solutions(
-    sync_infos: Mapping[Hint, SyncProviderInfo],
-    async_infos: Mapping[Hint, AsyncProviderInfo],
+    sync_infos: Mapping[Hint, SyncProviderInfo | TupleItemInfo],
+    async_infos: Mapping[Hint, ProviderInfo],
     current_types: Set[Hint],
 ) -> Callable[[], None]:
     full_infos = {**sync_infos, **async_infos}
@@ -55,7 +53,12 @@ def _set_solution(
     infos: Mapping[Hint, P],
     current_types: Set[Hint],
 ) -> Token[Solution[P]]:
-    dep_map = {cls: set(info["required_parameters"].values()) for cls, info in infos.items()}
+    dep_map = {
+        cls: {info.item_of}
+        if isinstance(info, TupleItemInfo)
+        else set(info.required_parameters.values())
+        for cls, info in infos.items()
+    }
     return var.set(Solution.from_infos_and_dependency_map(infos, dep_map, current_types))
 
 
@@ -75,6 +78,14 @@ class Solution(Generic[P]):
     """Mapping graph index to provider infos."""
     infos_by_type: Mapping[Hint, P]
     """Mapping types to provider infos."""
+    execution_order_cache: dict[tuple[frozenset[Hint], frozenset[Hint]], Sequence[Sequence[P]]] = (
+        field(default_factory=dict, init=False, repr=False, compare=False)
+    )
+    """Execution orders memoized by the types to include and exclude."""
+    descendant_types_cache: dict[Hint, Set[Hint]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """Descendant types memoized by the type they descend from."""
 
     @classmethod
     def from_infos_and_dependency_map(
@@ -94,15 +105,17 @@ class Solution(Generic[P]):
 
         infos_by_index = {index_by_type[tp]: info for tp, info in infos_by_type.items()}
 
-        for tp, deps in deps_by_type.items():
-            for dep in deps:
-                try:
-                    parent_index = index_by_type[dep]
-                except KeyError:
-                    msg = f"No provider for {dep}"
-                    raise SolutionError(msg) from None
-                child_index = index_by_type[tp]
-                index_graph.add_edge(parent_index, child_index, None)
+        if missing := set().union(*deps_by_type.values()) - index_by_type.keys():
+            msg = f"No provider for {', '.join(sorted(map(str, missing)))}"
+            raise SolutionError(msg)
+
+        index_graph.add_edges_from_no_data(
+            [
+                (index_by_type[dep], index_by_type[tp])
+                for tp, deps in deps_by_type.items()
+                for dep in deps
+            ]
+        )
 
         return cls(
             type_by_index=type_by_index,
@@ -114,36 +127,51 @@ class Solution(Generic[P]):
         )
 
     def descendant_types(self, cls: Hint) -> Set[Hint]:
-        type_by_index = self.type_by_index  # avoid extra attribute accesses
-        if cls not in self.index_by_type:
-            return set()
-        return {type_by_index[i] for i in descendants(self.index_graph, self.index_by_type[cls])}
+        if (types := self.descendant_types_cache.get(cls)) is None:
+            if (index := self.index_by_type.get(cls)) is None:
+                return frozenset()
+            type_by_index = self.type_by_index  # avoid extra attribute accesses
+            types = self.descendant_types_cache[cls] = frozenset(
+                type_by_index[i] for i in descendants(self.index_graph, index)
+            )
+        return types
 
     def execution_order_for(
         self,
         include_types: Collection[Hint],
         exclude_types: Collection[Hint],
+    ) -> Sequence[Sequence[P]]:
+        key = (frozenset(include_types), frozenset(self.index_by_type.keys() & exclude_types))
+        if (order := self.execution_order_cache.get(key)) is None:
+            order = self.execution_order_cache[key] = self._compute_execution_order(*key)
+        return order
+
+    def _compute_execution_order(
+        self,
+        include_types: Set[Hint],
+        exclude_types: Set[Hint],
     ) -> Sequence[Sequence[P]]:
         index_by_type = self.index_by_type  # avoid extra attribute accesses
-        solution_type_set = set(index_by_type)
         try:
             type_indices = {index_by_type[t] for t in include_types}
         except KeyError:
-            missing = set(include_types) - solution_type_set
+            missing = include_types - index_by_type.keys()
             msg = f"Missing providers for {missing}"
             raise InjectionError(msg) from None
         ancestor_indices = {p_i for i in type_indices for p_i in ancestors(self.index_graph, (i))}
         ancestor_pred_indices = ancestor_indices | type_indices
 
-        filter_indicies = {index_by_type[t] for t in solution_type_set.intersection(exclude_types)}
+        filter_indicies = {index_by_type[t] for t in exclude_types}
         infos = self.infos_by_index  # avoid extra attribute accesses
-        return [
-            [infos[i] for i in union]
+        return tuple(
+            tuple(infos[i] for i in union)
             for gen in self.index_ordering
             if (union := (gen & ancestor_pred_indices - filter_indicies))
-        ]
+        )
 
 
 _NO_SOLUTION = Solution.from_infos_and_dependency_map({}, {}, set())
-SYNC_SOLUTION = ContextVar[Solution[SyncProviderInfo]]("SYNC_SOLUTION", default=_NO_SOLUTION)
+SYNC_SOLUTION = ContextVar[Solution[SyncProviderInfo | TupleItemInfo]](
+    "SYNC_SOLUTION", default=_NO_SOLUTION
+)
 FULL_SOLUTION = ContextVar[Solution[ProviderInfo]]("FULL_SOLUTION", default=_NO_SOLUTION)
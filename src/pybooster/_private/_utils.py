@@ -12,12 +12,16 @@ from dataclasses import dataclass
 from inspect import Parameter
 from inspect import isclass
 from inspect import signature
-from sys import exc_info
+from inspect import unwrap
+from sys import exception
+from types import FunctionType
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 from typing import Annotated
 from typing import Any
 from typing import Literal
 from typing import NewType
+from typing import NoReturn
 from typing import ParamSpec
 from typing import TypedDict
 from typing import TypeVar
@@ -26,6 +30,7 @@ from typing import dataclass_transform
 from typing import get_args
 from typing import get_origin
 from typing import get_type_hints
+from weakref import WeakKeyDictionary
 
 from typing_extensions import TypeIs
 
@@ -77,7 +82,18 @@ def is_type(value: Any) -> TypeIs[type]:
 
 
 def make_sentinel_value(module: str, name: str) -> Any:
-    return type(name, (), {"__repr__": lambda _: f"{module}.{name}"})()
+    """Make a singleton that is pickled and copied by reference to `module.name`."""
+    cls = type(
+        name,
+        (),
+        {
+            "__slots__": (),
+            "__module__": module,
+            "__repr__": lambda _: f"{module}.{name}",
+            "__reduce__": lambda _: name,
+        },
+    )
+    return cls()
 
 
 undefined = make_sentinel_value(__name__, "undefined")
@@ -91,17 +107,17 @@ def get_required_parameters(
         case None:
             return _get_required_parameter_types(func)
         case Mapping():
-            params = _get_required_sig_parameters(func)
-            if (lpar := len(params)) > (ldep := len(dependencies)):
+            names = _get_required_parameter_names(func)
+            if (lpar := len(names)) > (ldep := len(dependencies)):
                 msg = f"Could not match {ldep} dependencies to {lpar} required parameters."
                 raise TypeError(msg)
-            return dependencies
+            return dict(dependencies)
         case Sequence():
-            params = _get_required_sig_parameters(func)
-            if (lpar := len(params)) > (ldep := len(dependencies)):
+            names = _get_required_parameter_names(func)
+            if (lpar := len(names)) > (ldep := len(dependencies)):
                 msg = f"Could not match {ldep} dependencies to {lpar} required parameters."
                 raise TypeError(msg)
-            return dict(zip((p.name for p in params), dependencies, strict=False))
+            return dict(zip(names, dependencies, strict=False))
         case _:  # nocov
             msg = f"Expected a mapping or sequence of dependencies, but got {dependencies!r}."
             raise TypeError(msg)
@@ -109,22 +125,68 @@ def get_required_parameters(
 
 def _get_required_parameter_types(func: Callable[P, R]) -> HintMap:
     required_params: dict[str, Hint] = {}
-    hints = get_type_hints(func, include_extras=True)
-    for param in _get_required_sig_parameters(func):
-        check_is_required_type(hint := hints[param.name])
-        required_params[param.name] = hint
+    if not (names := _get_required_parameter_names(func)):
+        return required_params  # no need to resolve type hints
+    hints = get_callable_type_hints(func)
+    for name in names:
+        check_is_required_type(hint := hints[name])
+        required_params[name] = hint
     return required_params
 
 
-def _get_required_sig_parameters(func: Callable[P, R]) -> list[Parameter]:
-    params: list[Parameter] = []
+def _get_required_parameter_names(func: Callable[P, R]) -> tuple[str, ...]:
+    """Get the names of parameters whose default is `pybooster.required`.
+
+    Plain functions are read from their defaults directly since building a full signature
+    is comparatively slow - anything else (e.g. partials or functions with a custom
+    `__signature__`) falls back to `inspect.signature`.
+    """
+    unwrapped = unwrap(func, stop=lambda f: hasattr(f, "__signature__"))
+    if type(unwrapped) is not FunctionType or hasattr(unwrapped, "__signature__"):
+        return _get_required_sig_parameter_names(func)
+    required = pybooster.required
+    if any(d is required for d in unwrapped.__defaults__ or ()):
+        return _get_required_sig_parameter_names(func)  # raises for positional parameters
+    return tuple(n for n, d in (unwrapped.__kwdefaults__ or {}).items() if d is required)
+
+
+def _get_required_sig_parameter_names(func: Callable[P, R]) -> tuple[str, ...]:
+    names: list[str] = []
+    # resolve these once rather than on every parameter
+    required, keyword_only = pybooster.required, Parameter.KEYWORD_ONLY
     for p in signature(func).parameters.values():
-        if p.default is pybooster.required:
-            if p.kind is not Parameter.KEYWORD_ONLY:
+        if p.default is required:
+            if p.kind is not keyword_only:
                 msg = f"Expected dependant parameter {p!r} to be keyword-only."
                 raise TypeError(msg)
-            params.append(p)
-    return params
+            names.append(p.name)
+    return tuple(names)
+
+
+def get_callable_type_hints(func: Callable) -> Mapping[str, Hint]:
+    """Get the type hints of a callable - cached for functions that can be weakly referenced.
+
+    Wrappers that share their wrapped function's annotations (e.g. via `functools.wraps`)
+    resolve to the same hints so they share a cache entry. The hints are read-only since
+    every caller shares them.
+    """
+    annotations = getattr(func, "__annotations__", None)
+    while (wrapped := getattr(func, "__wrapped__", None)) is not None and (
+        getattr(wrapped, "__annotations__", None) is annotations
+    ):
+        func = wrapped
+    try:
+        hints = _TYPE_HINTS_CACHE.get(func)
+    except TypeError:  # not weakly referenceable
+        return MappingProxyType(get_type_hints(func, include_extras=True))
+    if hints is None:
+        hints = _TYPE_HINTS_CACHE[func] = MappingProxyType(
+            get_type_hints(func, include_extras=True)
+        )
+    return hints
+
+
+_TYPE_HINTS_CACHE: WeakKeyDictionary[Callable, Mapping[str, Hint]] = WeakKeyDictionary()
 
 
 def get_raw_annotation(anno: Any) -> RawAnnotation:
@@ -191,7 +253,7 @@ def _recurse_type(cls: Any) -> Iterator[Any]:
 
 
 def get_callable_return_type(func: Callable) -> Hint:
-    anno = get_type_hints(func, include_extras=True).get("return", Any)
+    anno = get_callable_type_hints(func).get("return", Any)
     raw_anno = get_raw_annotation(anno)
     check_is_not_builtin_type(raw_anno)
     return anno
@@ -239,6 +301,8 @@ _Callback = (
 
 
 class _FastStack:
+    __slots__ = ("_callbacks",)
+
     def __init__(self) -> None:
         self._callbacks: list[_Callback] = []
 
@@ -257,10 +321,12 @@ class FastStack(_FastStack):
     Users must call `close` to ensure all callbacks are called.
     """
 
+    __slots__ = ()
+
     def close(self) -> None:
-        if cb_len := len(self._callbacks):
+        if self._callbacks:
             try:
-                _sync_unravel_stack(self._callbacks, cb_len - 1)
+                _sync_unravel_stack(self._callbacks)
             finally:
                 self._callbacks.clear()
 
@@ -271,6 +337,8 @@ class AsyncFastStack(_FastStack):
     Users must call `aclose` to ensure all callbacks are called.
     """
 
+    __slots__ = ()
+
     def push_async_callback(
         self, func: Callable[P, Awaitable], *args: P.args, **kwargs: P.kwargs
     ) -> None:
@@ -282,48 +350,88 @@ class AsyncFastStack(_FastStack):
         return result
 
     async def aclose(self) -> None:
-        if cb_len := len(self._callbacks):
+        if self._callbacks:
             try:
-                await _async_unravel_stack(self._callbacks, cb_len - 1)
+                await _async_unravel_stack(self._callbacks)
             finally:
                 self._callbacks.clear()
 
 
-def _sync_unravel_stack(callbacks: Sequence[_Callback], position: int) -> None:
-    try:
-        match callbacks[position]:
-            case [False, func, args, kwargs]:
-                func(*args, **kwargs)
-            case [False, exit]:
-                exit(*exc_info())
-            case _:  # nocov
-                msg = "Unexpected callback type"
-                raise AssertionError(msg)
-    finally:
-        if position > 0:
-            _sync_unravel_stack(callbacks, position - 1)
-
-
-async def _async_unravel_stack(callbacks: Sequence[_Callback], position: int) -> None:
+def _sync_unravel_stack(callbacks: Sequence[_Callback]) -> None:
+    frame_exc = exc = exception()
+    raised: BaseException | None = None
+    for callback in reversed(callbacks):
+        try:
+            match callback:
+                case [False, func, args, kwargs]:
+                    func(*args, **kwargs)
+                case [False, exit]:
+                    exit(*_exc_details(exc))
+                case _:  # nocov
+                    msg = "Unexpected callback type"
+                    raise AssertionError(msg)  # noqa: TRY301
+        except BaseException as new_exc:  # noqa: BLE001
+            _fix_exception_context(new_exc, exc, frame_exc)
+            exc = raised = new_exc
+    if raised is not None:
+        _reraise_with_context(raised)
+
+
+async def _async_unravel_stack(callbacks: Sequence[_Callback]) -> None:
+    frame_exc = exc = exception()
+    raised: BaseException | None = None
+    for callback in reversed(callbacks):
+        try:
+            match callback:
+                case [True, func, args, kwargs]:
+                    await func(*args, **kwargs)
+                case [False, func, args, kwargs]:
+                    func(*args, **kwargs)
+                case [True, exit]:
+                    await exit(*_exc_details(exc))
+                case [False, exit]:
+                    exit(*_exc_details(exc))
+                case _:  # nocov
+                    msg = "Unexpected callback type"
+                    raise AssertionError(msg)  # noqa: TRY301
+        except BaseException as new_exc:  # noqa: BLE001
+            _fix_exception_context(new_exc, exc, frame_exc)
+            exc = raised = new_exc
+    if raised is not None:
+        _reraise_with_context(raised)
+
+
+def _exc_details(exc: BaseException | None) -> tuple[Any, Any, Any]:
+    return (None, None, None) if exc is None else (type(exc), exc, exc.__traceback__)
+
+
+def _fix_exception_context(
+    new_exc: BaseException, old_exc: BaseException | None, frame_exc: BaseException | None
+) -> None:
+    # chain new exceptions to the one they interrupted - as nested finally blocks would
+    if old_exc is None or new_exc is old_exc:
+        return
+    while True:
+        exc_context = new_exc.__context__
+        if exc_context is old_exc:
+            return
+        if exc_context is None or exc_context is frame_exc:
+            break
+        new_exc = exc_context
+    new_exc.__context__ = old_exc
+
+
+def _reraise_with_context(exc: BaseException) -> NoReturn:
+    # raising replaces __context__ with the exception currently being handled so restore it
+    fixed_context = exc.__context__
     try:
-        match callbacks[position]:
-            case [True, func, args, kwargs]:
-                await func(*args, **kwargs)
-            case [False, func, args, kwargs]:
-                func(*args, **kwargs)
-            case [True, exit]:
-                await exit(*exc_info())
-            case [False, exit]:
-                exit(*exc_info())
-            case _:  # nocov
-                msg = "Unexpected callback type"
-                raise AssertionError(msg)
-    finally:
-        if position > 0:
-            await _async_unravel_stack(callbacks, position - 1)
+        raise exc  # noqa: TRY301
+    except BaseException:
+        exc.__context__ = fixed_context
+        raise
 
 
 @dataclass_transform(frozen_default=True, kw_only_default=True)
 def frozenclass(cls: type[R]) -> type[R]:
-    """Returm a frozen dataclass."""
-    return dataclass(frozen=True, kw_only=True)(cls)
+    """Returm a frozen and slotted dataclass."""
+    return dataclass(frozen=True, kw_only=True, slots=True)(cls)
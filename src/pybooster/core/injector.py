@@ -220,9 +220,11 @@ class CurrentValues(Mapping[Hint, Any]):
     def get(self, key: type[R], default: N = ...) -> R | N: ...  # nocov # noqa: D102
 
 
-class _SharedContext(
-    AbstractContextManager[CurrentValues], AbstractAsyncContextManager[CurrentValues]
-):
+class _SharedContext:
+    # not subclassing the contextlib ABCs - before Python 3.12 they lack __slots__ so
+    # instances would still get a __dict__ (they are structural so isinstance works anyway)
+    __slots__ = ("_async_stack", "_param_deps", "_param_vals", "_sync_stack")
+
     def __init__(
         self,
         param_vals: dict[str, Any],
@@ -230,15 +232,17 @@ class _SharedContext(
     ) -> None:
         self._param_vals = param_vals
         self._param_deps = param_deps
+        self._sync_stack: FastStack | None = None
+        self._async_stack: AsyncFastStack | None = None
 
     def __enter__(self) -> CurrentValues:
-        if hasattr(self, "_sync_stack"):
+        if self._sync_stack is not None:
             msg = "Cannot reuse a context manager."
             raise RuntimeError(msg)
-        self._sync_stack = FastStack()
+        self._sync_stack = stack = FastStack()
         params = self._param_vals.copy()
         sync_inject_into_params(
-            self._sync_stack,
+            stack,
             params,
             self._param_deps,
             keep_current_values=True,
@@ -247,18 +251,18 @@ class _SharedContext(
 
     def __exit__(self, *_: Any) -> None:
         try:
-            self._sync_stack.close()
+            self._sync_stack.close()  # type: ignore[reportOptionalMemberAccess]
         finally:
-            del self._sync_stack
+            self._sync_stack = None
 
     async def __aenter__(self) -> CurrentValues:
-        if hasattr(self, "_async_stack"):
+        if self._async_stack is not None:
             msg = "Cannot reuse a context manager."
             raise RuntimeError(msg)
-        self._async_stack = AsyncFastStack()
+        self._async_stack = stack = AsyncFastStack()
         params = self._param_vals.copy()
         await async_inject_into_params(
-            self._async_stack,
+            stack,
             params,
             self._param_deps,
             keep_current_values=True,
@@ -267,6 +271,6 @@ class _SharedContext(
 
     async def __aexit__(self, *exc: Any) -> None:
         try:
-            await self._async_stack.aclose()
+            await self._async_stack.aclose()  # type: ignore[reportOptionalMemberAccess]
         finally:
-            del self._async_stack
+            self._async_stack = None
@@ -4,6 +4,7 @@ from contextlib import AbstractAsyncContextManager
 from contextlib import AbstractContextManager
 from contextlib import asynccontextmanager as _asynccontextmanager
 from contextlib import contextmanager as _contextmanager
+from functools import partial
 from functools import wraps
 from typing import TYPE_CHECKING
 from typing import Any
@@ -23,10 +24,8 @@ from pybooster._private._utils import get_iterator_yield_type
 from pybooster._private._utils import get_required_parameters
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
     from collections.abc import Awaitable
     from collections.abc import Callable
-    from collections.abc import Iterator
 
     from pybooster.types import AsyncContextManagerCallable
     from pybooster.types import AsyncIteratorCallable
@@ -57,12 +56,13 @@ def function(
         provides: The type that the function provides (infered if not provided).
     """
     provides = provides or get_callable_return_type(func)
+    requires = get_required_parameters(func, requires)
 
     @wraps(func)
-    def wrapper(*args: P.args, **kwargs: P.kwargs) -> Iterator[R]:
-        yield func(*args, **kwargs)
+    def producer(*args: P.args, **kwargs: P.kwargs) -> _FunctionContext[R]:
+        return _FunctionContext(func, args, kwargs)
 
-    return iterator(wrapper, provides=provides, requires=requires)
+    return SyncProvider(producer, cast("type[R]", provides), requires)
 
 
 @paramorator
@@ -80,12 +80,13 @@ def asyncfunction(
         provides: The type that the function provides (infered if not provided).
     """
     provides = provides or get_coroutine_return_type(func)
+    requires = get_required_parameters(func, requires)
 
     @wraps(func)
-    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> AsyncIterator[R]:
-        yield await func(*args, **kwargs)
+    def producer(*args: P.args, **kwargs: P.kwargs) -> _AsyncFunctionContext[R]:
+        return _AsyncFunctionContext(func, args, kwargs)
 
-    return asynciterator(wrapper, provides=provides, requires=requires)
+    return AsyncProvider(producer, cast("type[R]", provides), requires)
 
 
 @paramorator
@@ -126,7 +127,43 @@ def asynciterator(
     return AsyncProvider(_asynccontextmanager(func), cast("type[R]", provides), requires)
 
 
+class _FunctionContext(Generic[R]):
+    """A lighter weight equivalent of a `contextmanager` that yields the result of a function."""
+
+    __slots__ = ("_args", "_func", "_kwargs")
+
+    def __init__(self, func: Callable[..., R], args: Any, kwargs: Any) -> None:
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+
+    def __enter__(self) -> R:
+        return self._func(*self._args, **self._kwargs)
+
+    def __exit__(self, *_: Any) -> None:
+        return None
+
+
+class _AsyncFunctionContext(Generic[R]):
+    """A lighter weight equivalent of an `asynccontextmanager` that yields a coroutine result."""
+
+    __slots__ = ("_args", "_func", "_kwargs")
+
+    def __init__(self, func: Callable[..., Awaitable[R]], args: Any, kwargs: Any) -> None:
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+
+    async def __aenter__(self) -> R:
+        return await self._func(*self._args, **self._kwargs)
+
+    async def __aexit__(self, *_: Any) -> None:
+        return None
+
+
 class _BaseProvider(Generic[R]):
+    __slots__ = ("__weakref__", "dependencies", "producer", "provides")
+
     producer: Any
     provides: Hint | InferHint
     dependencies: HintMap
@@ -145,8 +182,7 @@ class _BaseProvider(Generic[R]):
                 raise TypeError(msg)
             producer = self.producer
             provides = get_provides_type(self.provides, *args, **kwargs)
-            wrapped = wraps(producer)(lambda **kw: producer(*args, **kwargs, **kw))
-            return type(self)(wrapped, provides, self.dependencies)
+            return type(self)(partial(producer, *args, **kwargs), provides, self.dependencies)
 
         def __call__(self, *args, **kwargs):
             return self.producer(*args, **kwargs)
@@ -155,6 +191,8 @@ class _BaseProvider(Generic[R]):
 class SyncProvider(Generic[P, R], _BaseProvider[R]):
     """A provider for a dependency."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         producer: ContextManagerCallable[P, R],
@@ -177,6 +215,8 @@ class SyncProvider(Generic[P, R], _BaseProvider[R]):
 class AsyncProvider(Generic[P, R], _BaseProvider[R]):
     """A provider for a dependency."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         producer: AsyncContextManagerCallable[P, R],
@@ -1,24 +1,35 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from contextlib import contextmanager
+from functools import wraps
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import ParamSpec
+from typing import TypeVar
+from typing import overload
+from weakref import WeakKeyDictionary
 
 from pybooster._private._injector import _CURRENT_VALUES
-from pybooster._private._provider import AsyncProviderInfo
+from pybooster._private._provider import ProviderInfo
 from pybooster._private._provider import SyncProviderInfo
+from pybooster._private._provider import TupleItemInfo
 from pybooster._private._provider import get_provider_info
 from pybooster._private._solution import set_solutions
+from pybooster.core.provider import AsyncProvider
 from pybooster.core.provider import Provider
 from pybooster.core.provider import SyncProvider
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable
+    from collections.abc import Mapping
 
+    from pybooster.types import Hint
 
-@contextmanager
-def solved(*providers: Provider[[], Any] | Sequence[Provider[[], Any]]) -> Iterator[None]:
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def solved(*providers: Provider[[], Any] | Sequence[Provider[[], Any]]) -> _SolvedContext:
     """Resolve the dependency graph defined by the given providers during the context.
 
     Args:
@@ -26,25 +37,50 @@ def solved(*providers: Provider[[], Any] | Sequence[Provider[[], Any]]) -> Itera
             The providers that define the dependency graph to be resolved given
             as positional arguments or as sequences of providers.
     """
-    if not providers:
-        msg = "At least one provider must be given."
-        raise ValueError(msg)
-    sync_infos: dict[type, SyncProviderInfo] = {}
-    async_infos: dict[type, AsyncProviderInfo] = {}
-    for p in _normalize_providers(providers):
-        if isinstance(p, SyncProvider):
-            sync_infos.update(
-                get_provider_info(p.producer, p.provides, p.dependencies, is_sync=True)
-            )
-        else:
-            async_infos.update(
-                get_provider_info(p.producer, p.provides, p.dependencies, is_sync=False)
-            )
-    reset = set_solutions(sync_infos, async_infos, _CURRENT_VALUES.get().keys())
-    try:
-        yield
-    finally:
-        reset()
+    return _SolvedContext(providers)
+
+
+class _SolvedContext:
+    # a plain class avoids the generator machinery of contextlib.contextmanager - not using
+    # contextlib.ContextDecorator since it lacks __slots__ so instances would get a __dict__
+    __slots__ = ("_providers", "_reset")
+
+    def __init__(
+        self, providers: Sequence[Provider[[], Any] | Sequence[Provider[[], Any]]]
+    ) -> None:
+        self._providers = providers
+        self._reset: Callable[[], None] | None = None
+
+    def __call__(self, func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            # use a fresh context per call so the decorated function can be reentered
+            with _SolvedContext(self._providers):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def __enter__(self) -> None:
+        if self._reset is not None:
+            msg = "Cannot reuse a context manager."
+            raise RuntimeError(msg)
+        if not self._providers:
+            msg = "At least one provider must be given."
+            raise ValueError(msg)
+        sync_infos: dict[type, SyncProviderInfo | TupleItemInfo] = {}
+        async_infos: dict[type, ProviderInfo] = {}
+        for p in _normalize_providers(self._providers):
+            if isinstance(p, SyncProvider):
+                sync_infos.update(_get_provider_infos(p))
+            else:
+                async_infos.update(_get_provider_infos(p))
+        self._reset = set_solutions(sync_infos, async_infos, _CURRENT_VALUES.get().keys())
+
+    def __exit__(self, *_: Any) -> None:
+        try:
+            self._reset()  # type: ignore[reportOptionalCall]
+        finally:
+            self._reset = None
 
 
 def _normalize_providers(
@@ -54,3 +90,30 @@ def _normalize_providers(
     for p in providers:
         normalized.extend(p) if isinstance(p, Sequence) else normalized.append(p)
     return normalized
+
+
+@overload
+def _get_provider_infos(
+    provider: SyncProvider[[], Any],
+) -> Mapping[Hint, SyncProviderInfo | TupleItemInfo]: ...
+
+
+@overload
+def _get_provider_infos(provider: AsyncProvider[[], Any]) -> Mapping[Hint, ProviderInfo]: ...
+
+
+def _get_provider_infos(provider: Provider[[], Any]) -> Mapping[Hint, ProviderInfo]:
+    """Get the infos for a provider - cached since providers are not modified once created."""
+    if (infos := _PROVIDER_INFOS.get(provider)) is None:
+        infos = _PROVIDER_INFOS[provider] = get_provider_info(
+            provider.producer,
+            provider.provides,
+            provider.dependencies,
+            is_sync=isinstance(provider, SyncProvider),
+        )
+    return infos
+
+
+_PROVIDER_INFOS: WeakKeyDictionary[Provider[[], Any], Mapping[Hint, ProviderInfo]] = (
+    WeakKeyDictionary()
+)
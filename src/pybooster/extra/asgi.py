@@ -48,19 +48,17 @@ class PyBoosterMiddleware:
 
 
 def _set_scope_state(scope: Scope, state: _ScopeState) -> None:
-    try:
-        scope["state"][_SCOPE_STATE_NAME] = state
-    except KeyError:  # nocov
+    if (lifespan_state := scope.get("state")) is None:  # nocov
         msg = "Server does not support lifespan state."
-        raise RuntimeError(msg) from None
+        raise RuntimeError(msg)
+    lifespan_state[_SCOPE_STATE_NAME] = state
 
 
 def _get_scope_state(scope: Scope) -> _ScopeState | None:
-    try:
-        return scope["state"].get(_SCOPE_STATE_NAME)
-    except KeyError:  # nocov
+    if (lifespan_state := scope.get("state")) is None:  # nocov
         msg = "Server does not support lifespan state."
-        raise RuntimeError(msg) from None
+        raise RuntimeError(msg)
+    return lifespan_state.get(_SCOPE_STATE_NAME)
 
 
 class _ScopeState(TypedDict):
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from asyncio import Barrier
 from asyncio import wait_for
+from collections.abc import AsyncIterator
 from collections.abc import Callable
 from collections.abc import Iterator
 from dataclasses import dataclass
@@ -10,7 +12,6 @@ from typing import NewType
 from typing import TypeVar
 
 import pytest
-from anyio import Event
 
 from pybooster import injector
 from pybooster import provider
@@ -20,6 +21,7 @@ from pybooster.types import InjectionError
 from pybooster.types import SolutionError
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from collections.abc import Callable
     from collections.abc import Iterator
 
@@ -43,11 +45,36 @@ Right = NewType("Right", str)
 Bottom = NewType("Bottom", str)
 
 
-def test_sync_function_injection():
-    @provider.function
-    def greeting_provider() -> Greeting:
-        return Greeting("Hello")
+@provider.function
+def sync_function_greeting_provider() -> Greeting:
+    return Greeting("Hello")
+
+
+@provider.iterator
+def sync_iterator_greeting_provider() -> Iterator[Greeting]:
+    yield Greeting("Hello")
+
+
+@provider.asyncfunction
+async def async_function_greeting_provider() -> Greeting:
+    return Greeting("Hello")
 
+
+@provider.asynciterator
+async def async_iterator_greeting_provider() -> AsyncIterator[Greeting]:
+    yield Greeting("Hello")
+
+
+SYNC_GREETING_PROVIDERS = [sync_function_greeting_provider, sync_iterator_greeting_provider]
+ALL_GREETING_PROVIDERS = [
+    *SYNC_GREETING_PROVIDERS,
+    async_function_greeting_provider,
+    async_iterator_greeting_provider,
+]
+
+
+@pytest.mark.parametrize("greeting_provider", SYNC_GREETING_PROVIDERS)
+def test_sync_function_injection(greeting_provider):
     @injector.function
     def get_message(*, greeting: Greeting = required):
         return f"{greeting} World"
@@ -56,11 +83,8 @@ def test_sync_function_injection():
         assert get_message() == "Hello World"
 
 
-def test_sync_iterator_injection():
-    @provider.function
-    def greeting_provider() -> Greeting:
-        return Greeting("Hello")
-
+@pytest.mark.parametrize("greeting_provider", SYNC_GREETING_PROVIDERS)
+def test_sync_iterator_injection(greeting_provider):
     @injector.iterator
     def get_message(*, greeting: Greeting = required):
         yield f"{greeting} World"
@@ -69,11 +93,8 @@ def test_sync_iterator_injection():
         assert list(get_message()) == ["Hello World"]
 
 
-def test_sync_context_manager_injection():
-    @provider.function
-    def greeting_provider() -> Greeting:
-        return Greeting("Hello")
-
+@pytest.mark.parametrize("greeting_provider", SYNC_GREETING_PROVIDERS)
+def test_sync_context_manager_injection(greeting_provider):
     @injector.contextmanager
     def get_message(*, greeting: Greeting = required):
         yield f"{greeting} World"
@@ -83,11 +104,8 @@ def test_sync_context_manager_injection():
             assert message == "Hello World"
 
 
-async def test_async_function_injection():
-    @provider.asyncfunction
-    async def greeting_provider() -> Greeting:
-        return Greeting("Hello")
-
+@pytest.mark.parametrize("greeting_provider", ALL_GREETING_PROVIDERS)
+async def test_async_function_injection(greeting_provider):
     @injector.asyncfunction
     async def get_message(*, greeting: Greeting = required):
         return f"{greeting} World"
@@ -96,11 +114,8 @@ async def test_async_function_injection():
         assert await get_message() == "Hello World"
 
 
-async def test_async_iterator_injection():
-    @provider.asyncfunction
-    async def greeting_provider() -> Greeting:
-        return Greeting("Hello")
-
+@pytest.mark.parametrize("greeting_provider", ALL_GREETING_PROVIDERS)
+async def test_async_iterator_injection(greeting_provider):
     @injector.asynciterator
     async def get_message(*, greeting: Greeting = required):
         yield f"{greeting} World"
@@ -109,11 +124,8 @@ async def test_async_iterator_injection():
         assert [v async for v in get_message()] == ["Hello World"]
 
 
-async def test_async_context_manager_injection():
-    @provider.asyncfunction
-    async def greeting_provider() -> Greeting:
-        return Greeting("Hello")
-
+@pytest.mark.parametrize("greeting_provider", ALL_GREETING_PROVIDERS)
+async def test_async_context_manager_injection(greeting_provider):
     @injector.asynccontextmanager
     async def get_message(*, greeting: Greeting = required):
         yield f"{greeting} World"
@@ -146,10 +158,6 @@ async def test_sync_and_async_providers_do_not_overwrite_each_other():
 
 
 async def test_async_provider_can_depend_on_sync_provider():
-    @provider.function
-    def greeting_provider() -> Greeting:
-        return Greeting("Hello")
-
     @provider.asyncfunction
     async def message_provider(*, greeting: Greeting = required) -> Message:
         return Message(f"{greeting} World")
@@ -158,7 +166,7 @@ async def test_async_provider_can_depend_on_sync_provider():
     async def get_message(*, message: Message = required):
         return message
 
-    with solved(greeting_provider, message_provider):
+    with solved(sync_function_greeting_provider, message_provider):
         assert await get_message() == "Hello World"
 
 
@@ -182,6 +190,20 @@ async def test_sync_provider_cannot_depend_on_async_provider():
         pass  # nocov
 
 
+def test_missing_providers_are_listed_in_sorted_order():
+    @provider.function
+    def message_provider(
+        *, _recipient: Recipient = required, _greeting: Greeting = required
+    ) -> Message:
+        raise AssertionError
+
+    with (
+        pytest.raises(SolutionError, match=r"No provider for .*\.Greeting, .*\.Recipient$"),
+        solved(message_provider),
+    ):
+        pass  # nocov
+
+
 @pytest.mark.parametrize("returns", [str, list, list[str]], ids=str)
 def test_disallow_builtin_type_as_provided_depdency(returns):
     def f():
@@ -356,7 +378,7 @@ def test_dependency_not_reused_by_inner_calls():
 UserId = NewType("UserId", int)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Profile:
     name: str
     bio: str
@@ -403,10 +425,6 @@ def test_raise_on_missing_params():
 
 
 async def test_async_provider_can_depend_on_sync_and_async_providers_at_the_same_time():
-    @provider.function
-    def greeting_provider() -> Greeting:
-        return Greeting("Hello")
-
     @provider.asyncfunction
     async def recipient_provider() -> Recipient:
         return Recipient("World")
@@ -421,24 +439,22 @@ async def test_async_provider_can_depend_on_sync_and_async_providers_at_the_same
     async def get_message(*, message: Message = required):
         return message
 
-    with solved(greeting_provider, recipient_provider, message_provider):
+    with solved(sync_function_greeting_provider, recipient_provider, message_provider):
         assert await get_message() == "Hello World"
 
 
 async def test_async_providers_are_executed_concurrently_if_possible():
-    did_begin_greeting = Event()
-    did_begin_recipient = Event()
+    # both providers must be running at the same time to pass the barrier
+    barrier = Barrier(2)
 
     @provider.asyncfunction
     async def greeting_provider() -> Greeting:
-        did_begin_greeting.set()
-        await did_begin_recipient.wait()
+        await barrier.wait()
         return Greeting("Hello")
 
     @provider.asyncfunction
     async def recipient_provider() -> Recipient:
-        did_begin_recipient.set()
-        await did_begin_greeting.wait()
+        await barrier.wait()
         return Recipient("World")
 
     @provider.asyncfunction
@@ -456,11 +472,7 @@ async def test_async_providers_are_executed_concurrently_if_possible():
 
 
 def test_cannot_enter_shared_context_more_than_once():
-    @provider.function
-    def greeting_provider() -> Greeting:
-        return Greeting("Hello")
-
-    with solved(greeting_provider):
+    with solved(sync_function_greeting_provider):
         ctx = injector.shared(Greeting)
         with ctx:
             with pytest.raises(RuntimeError, match=r"Cannot reuse a context manager."):
@@ -469,11 +481,7 @@ def test_cannot_enter_shared_context_more_than_once():
 
 
 async def test_cannot_async_enter_shared_context_more_than_once():
-    @provider.function
-    def greeting_provider() -> Greeting:
-        return Greeting("Hello")
-
-    with solved(greeting_provider):
+    with solved(sync_function_greeting_provider):
         ctx = injector.shared(Greeting)
         async with ctx:
             with pytest.raises(RuntimeError, match=r"Cannot reuse a context manager."):
@@ -491,11 +499,7 @@ def test_cannot_bind_required_provider_parameters():
 
 
 def test_can_call_provider_directly():
-    @provider.function
-    def greeting_provider() -> Greeting:
-        return Greeting("Hello")
-
-    with greeting_provider() as greeting:
+    with sync_function_greeting_provider() as greeting:
         assert greeting == "Hello"
 
 
@@ -514,6 +518,27 @@ def test_solution_requires_at_least_one_provider():
             raise AssertionError
 
 
+def test_solution_can_be_used_as_decorator():
+    @injector.function
+    def get_greeting(*, greeting: Greeting = required) -> Greeting:
+        return greeting
+
+    @solved(sync_function_greeting_provider)
+    def recurse(depth: int) -> Greeting:
+        return recurse(depth - 1) if depth else get_greeting()
+
+    assert recurse(2) == "Hello"
+    assert recurse(0) == "Hello"
+
+
+def test_solution_context_cannot_be_reused():
+    context = solved(sync_function_greeting_provider)
+    with context:
+        with pytest.raises(RuntimeError, match=r"Cannot reuse a context manager"):
+            with context:
+                raise AssertionError
+
+
 def test_cannot_provide_union():
     @provider.function
     def greeting_provider() -> Greeting | Recipient:  # nocov
@@ -525,10 +550,6 @@ def test_cannot_provide_union():
 
 
 async def test_async_func_requires_only_sync_providers():
-    @provider.function
-    def greeting_provider() -> Greeting:
-        return Greeting("Hello")
-
     @provider.function
     def recipient_provider() -> Recipient:
         return Recipient("World")
@@ -537,17 +558,13 @@ async def test_async_func_requires_only_sync_providers():
     async def get_message(*, greeting: Greeting = required, recipient: Recipient = required):
         return f"{greeting}, {recipient}!"
 
-    with solved(greeting_provider, recipient_provider):
+    with solved(sync_function_greeting_provider, recipient_provider):
         assert (await get_message()) == "Hello, World!"
 
 
 def test_injecting_current_value_does_not_invalidate_providers():
     call_count = 0
 
-    @provider.function
-    def greeting_provider() -> Greeting:
-        return Greeting("Hello")
-
     @provider.function
     def message_provider(*, greeting: Greeting = required) -> Message:
         nonlocal call_count
@@ -558,7 +575,7 @@ def test_injecting_current_value_does_not_invalidate_providers():
     def get_double_greeting_message(*, greeting: Greeting = required, message: Message = required):
         return f"{greeting} {message}"
 
-    with solved(greeting_provider, message_provider):
+    with solved(sync_function_greeting_provider, message_provider):
         with injector.shared(Greeting, Message) as values:
             assert call_count == 1
             assert get_double_greeting_message(greeting=values[Greeting]) == "Hello Hello, World!"
@@ -580,15 +597,11 @@ async def test_async_shared_context_with_dependencies_and_overrides():
 
 
 def test_can_pass_directly_without_any_solution():
-    @provider.function
-    def greeting_provider() -> Greeting:
-        return Greeting("Hello")
-
     @injector.function
     def get_message(*, greeting: Greeting = required, recipient: Recipient = required):
         return f"{greeting}, {recipient}!"
 
-    with solved(greeting_provider):
+    with solved(sync_function_greeting_provider):
         assert get_message(recipient=Recipient("World")) == "Hello, World!"
 
 
@@ -604,3 +617,45 @@ def test_implicit_provider_from_current_values():
     with injector.shared((Greeting, "Hello")):
         with solved(message_provider):
             assert get_message() == "Hello, World!"
+
+
+@pytest.mark.parametrize("is_sync", [True, False])
+async def test_tuple_provider_entered_once_for_all_items(is_sync):
+    calls = 0
+
+    def make_greeting_and_recipient() -> tuple[Greeting, Recipient]:
+        nonlocal calls
+        calls += 1
+        return Greeting("Hello"), Recipient("World")
+
+    if is_sync:
+        greeting_and_recipient_provider = provider.function(make_greeting_and_recipient)
+    else:
+
+        @provider.asyncfunction
+        async def greeting_and_recipient_provider() -> tuple[Greeting, Recipient]:
+            return make_greeting_and_recipient()
+
+    @injector.asyncfunction
+    async def get_message(
+        *, greeting: Greeting = required, recipient: Recipient = required
+    ) -> Message:
+        return Message(f"{greeting}, {recipient}!")
+
+    with solved(greeting_and_recipient_provider):
+        assert await get_message() == "Hello, World!"
+    assert calls == 1
+
+
+def test_tuple_items_are_read_from_shared_tuple_value():
+    @provider.function
+    def greeting_and_recipient_provider() -> tuple[Greeting, Recipient]:
+        raise AssertionError  # nocov
+
+    @injector.function
+    def get_message(*, greeting: Greeting = required, recipient: Recipient = required) -> Message:
+        return Message(f"{greeting}, {recipient}!")
+
+    with solved(greeting_and_recipient_provider):
+        with injector.shared((tuple[Greeting, Recipient], (Greeting("Hi"), Recipient("You")))):
+            assert get_message() == "Hi, You!"
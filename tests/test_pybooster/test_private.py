@@ -1,21 +1,43 @@
+import pickle  # noqa: S403
 from collections.abc import AsyncIterator
 from collections.abc import Coroutine
 from collections.abc import Iterator
+from collections.abc import Mapping
+from contextlib import AbstractAsyncContextManager
+from contextlib import AbstractContextManager
 from contextlib import asynccontextmanager
 from contextlib import contextmanager
+from contextlib import nullcontext
+from copy import copy
+from copy import deepcopy
+from functools import partial
+from functools import wraps
+from types import MappingProxyType
+from typing import Any
+from typing import NewType
 
 import pytest
 from anyio import create_task_group
 
 from pybooster import injector
+from pybooster import provider
 from pybooster import required
+from pybooster import solved
+from pybooster._private import _injector
+from pybooster._private._injector import _CURRENT_VALUES
+from pybooster._private._provider import TupleItemInfo
+from pybooster._private._provider import get_provider_info
 from pybooster._private._provider import get_provides_type
+from pybooster._private._solution import Solution
 from pybooster._private._utils import AsyncFastStack
 from pybooster._private._utils import FastStack
+from pybooster._private._utils import get_callable_type_hints
 from pybooster._private._utils import get_coroutine_return_type
 from pybooster._private._utils import get_iterator_yield_type
 from pybooster._private._utils import get_required_parameters
 from pybooster._private._utils import start_future
+from pybooster._private._utils import undefined
+from pybooster.core.solution import _get_provider_infos
 
 
 async def test_start_future_raises_if_called_early():
@@ -35,6 +57,16 @@ def test_required_parameter_must_be_kw_only():
             raise AssertionError
 
 
+def test_get_required_parameters_for_non_function_callables():
+    def func(x: Expected, *, a: Expected = required, b: int = 1, c: Expected = required): ...
+
+    assert get_required_parameters(func, [Expected, Expected]) == {"a": Expected, "c": Expected}
+    assert get_required_parameters(partial(func, 1), [Expected, Expected]) == {
+        "a": Expected,
+        "c": Expected,
+    }
+
+
 def test_fast_stack_callback():
     stack = FastStack()
 
@@ -98,6 +130,23 @@ def test_fast_stack_exception_stack_preserved():
     assert [e.value for e in errors] == [4, 3, 2]  # the last error isn't appended
 
 
+def test_fast_stack_callback_errors_are_chained():
+    stack = FastStack()
+
+    def raise_value_error(value: str):
+        raise ValueError(value)
+
+    stack.push_callback(raise_value_error, "first")
+    stack.push_callback(lambda: None)
+    stack.push_callback(raise_value_error, "last")
+
+    with pytest.raises(ValueError, match="first") as exc_info:
+        stack.close()
+
+    assert str(exc_info.value.__context__) == "last"
+    assert exc_info.value.__context__.__context__ is None
+
+
 async def test_async_fast_stack_callback():
     stack = AsyncFastStack()
 
@@ -207,3 +256,152 @@ def test_get_iterator_yield_type():
     async def async_returns_iterator() -> AsyncIterator[Expected]: ...
 
     assert get_iterator_yield_type(async_returns_iterator, sync=False) is Expected
+
+
+@pytest.mark.parametrize("sentinel", [required, undefined], ids=repr)
+def test_sentinel_values_are_singletons(sentinel):
+    assert pickle.loads(pickle.dumps(sentinel)) is sentinel  # noqa: S301
+    assert copy(sentinel) is sentinel
+    assert deepcopy(sentinel) is sentinel
+    assert not hasattr(sentinel, "__dict__")
+
+
+def test_get_callable_type_hints_is_cached():
+    def func(*, a: Expected = required) -> Expected: ...
+
+    @wraps(func)
+    def wrapper(*args, **kwargs): ...
+
+    hints = get_callable_type_hints(func)
+    assert hints == {"a": Expected, "return": Expected}
+    assert get_callable_type_hints(func) is hints
+    assert get_callable_type_hints(wrapper) is hints
+    with pytest.raises(TypeError):
+        hints["a"] = int  # type: ignore[reportIndexIssue]
+
+
+def test_get_required_parameters_copies_requires_map():
+    def func(*, a: Expected = required): ...
+
+    requires = MappingProxyType({"a": Expected})
+    params = get_required_parameters(func, requires)
+    assert type(params) is dict
+    assert params == requires
+
+
+def test_solution_execution_order_is_memoized():
+    infos = get_provider_info(nullcontext, Expected, {}, is_sync=True)
+    solution = Solution.from_infos_and_dependency_map(infos, {Expected: set()}, set())
+
+    order = solution.execution_order_for([Expected], {})
+    assert order == ((infos[Expected],),)
+    assert solution.execution_order_for({Expected}, {}) is order
+    assert solution.execution_order_for([Expected], {Expected: Expected()}) == ()
+
+
+def test_current_values_not_copied_when_nothing_changes():
+    @injector.function
+    def get_current_values(*, _: Expected = required) -> Mapping[Any, Any]:
+        return _CURRENT_VALUES.get()
+
+    with injector.shared((Expected, Expected())):
+        outer_values = _CURRENT_VALUES.get()
+        assert get_current_values() is outer_values
+        with injector.shared(Expected):
+            assert _CURRENT_VALUES.get() is outer_values
+
+
+def test_solution_descendant_types_are_memoized():
+    infos = get_provider_info(nullcontext, Expected, {"enter_result": int}, is_sync=True)
+    solution = Solution.from_infos_and_dependency_map(infos, {Expected: {int}}, {int})
+
+    descendants = solution.descendant_types(int)
+    assert descendants == {Expected}
+    assert solution.descendant_types(int) is descendants
+    assert solution.descendant_types(str) == set()
+
+
+def test_get_required_parameters_skips_type_hints_if_none_required():
+    def func(*, a: "UndefinedName" = 1): ...  # type: ignore[reportUndefinedVariable] # noqa: F821
+
+    assert get_required_parameters(func) == {}
+
+
+def test_provider_infos_are_cached_per_provider():
+    @provider.function
+    def expected_provider() -> Expected:
+        return Expected()
+
+    infos = _get_provider_infos(expected_provider)
+    assert list(infos) == [Expected]
+    assert _get_provider_infos(expected_provider) is infos
+    assert _get_provider_infos(expected_provider.bind()) is not infos
+
+
+async def test_async_tuple_items_are_read_without_a_task_group(monkeypatch):
+    other = NewType("other", Expected)
+    task_groups = []
+
+    def spy_create_task_group():
+        task_groups.append(None)
+        return create_task_group()
+
+    monkeypatch.setattr(_injector, "create_task_group", spy_create_task_group)
+
+    @provider.asyncfunction
+    async def pair_provider() -> tuple[Expected, other]:
+        return Expected(), other(Expected())
+
+    infos = _get_provider_infos(pair_provider)
+    item_infos = [infos[Expected], infos[other]]
+    assert all(isinstance(i, TupleItemInfo) for i in item_infos)
+    assert all(i.item_of == tuple[Expected, other] for i in item_infos)
+
+    @injector.asyncfunction
+    async def get_pair(*, a: Expected = required, b: other = required) -> tuple[Expected, other]:
+        return a, b
+
+    with solved(pair_provider):
+        a, b = await get_pair()
+    assert type(a) is Expected
+    assert type(b) is Expected
+    assert task_groups == []
+
+
+def test_shared_context_is_a_context_manager():
+    context = injector.shared()
+    assert isinstance(context, AbstractContextManager)
+    assert isinstance(context, AbstractAsyncContextManager)
+
+
+def make_expected() -> Expected:
+    return Expected()
+
+
+async def make_expected_async() -> Expected:
+    return Expected()
+
+
+def make_solution() -> Solution:
+    infos = get_provider_info(nullcontext, Expected, {}, is_sync=True)
+    return Solution.from_infos_and_dependency_map(infos, {Expected: set()}, set())
+
+
+@pytest.mark.parametrize(
+    "make_object",
+    [
+        pytest.param(injector.shared, id="shared context"),
+        pytest.param(FastStack, id="fast stack"),
+        pytest.param(AsyncFastStack, id="async fast stack"),
+        pytest.param(make_solution, id="solution"),
+        pytest.param(lambda: solved(provider.function(make_expected)), id="solved context"),
+        pytest.param(
+            lambda: get_provider_info(nullcontext, Expected, {}, is_sync=True)[Expected],
+            id="provider info",
+        ),
+        pytest.param(lambda: provider.function(make_expected), id="sync provider"),
+        pytest.param(lambda: provider.asyncfunction(make_expected_async), id="async provider"),
+    ],
+)
+def test_objects_have_no_instance_dict(make_object):
+    assert not hasattr(make_object(), "__dict__")